@@ -2,12 +2,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-import pandas as pd
-import yaml
+import numpy as np
 from loguru import logger
 
+from src.tools.fs_utils import ensure_dir
+from src.tools.projection_numba import project_compounded
+from src.tools.yaml_cache import load_yaml
+
 
 @dataclass
 class ConsumerFrameworkConfig:
@@ -20,15 +24,29 @@ class ConsumerDataAgent:
     self.blueprint = blueprint
 
   def load_portfolio(self) -> Dict[str, Any]:
-    holdings = pd.DataFrame(self.blueprint["portfolio"]["holdings"])
-    holdings["value"] = holdings["quantity"] * holdings["price"]
-    holdings["weight"] = holdings["value"] / holdings["value"].sum()
+    raw = self.blueprint["portfolio"]["holdings"]
+    count = len(raw)
+    quantity = np.fromiter((h["quantity"] for h in raw), dtype=np.float64, count=count)
+    price = np.fromiter((h["price"] for h in raw), dtype=np.float64, count=count)
+    value = quantity * price
+    total_value = float(value.sum())
+
+    # Column-oriented NumPy arrays: all downstream analytics are vectorized
+    # one-liners without DataFrame block-manager overhead.
+    holdings = {
+      "symbol": np.array([h["symbol"] for h in raw]),
+      "asset_class": np.array([h["asset_class"] for h in raw]),
+      "quantity": quantity,
+      "price": price,
+      "value": value,
+      "weight": value / total_value,
+    }
 
-    logger.info("Loaded consumer portfolio with {} positions", len(holdings))
+    logger.info("Loaded consumer portfolio with {} positions", count)
 
     return {
       "holdings": holdings,
-      "total_value": holdings["value"].sum(),
+      "total_value": total_value,
       "profile": self.blueprint.get("user_profile", {}),
     }
 
@@ -37,17 +55,31 @@ class ConsumerAnalyticsAgent:
   def __init__(self, blueprint: Dict[str, Any]):
     self.blueprint = blueprint
 
-  def summarize_allocation(self, holdings: pd.DataFrame) -> Dict[str, Any]:
-    allocation = holdings.groupby("asset_class")["value"].sum()
-    weights = (allocation / allocation.sum()).to_dict()
+  def summarize_allocation(self, holdings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    values = holdings["value"]
+    total = float(values.sum())
+
+    classes, codes = np.unique(holdings["asset_class"], return_inverse=True)
+    sums = np.bincount(codes, weights=values, minlength=len(classes))
+    weights = dict(zip(classes.tolist(), (sums / total).tolist()))
 
-    top_positions = holdings.sort_values("value", ascending=False).head(5)[
-      ["symbol", "asset_class", "value", "weight"]
-    ].to_dict(orient="records")
+    k = min(5, len(values))
+    top_idx = np.argpartition(-values, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-values[top_idx])]
+    top_positions = [
+      {
+        "symbol": holdings["symbol"][i],
+        "asset_class": holdings["asset_class"][i],
+        "value": float(values[i]),
+        "weight": float(holdings["weight"][i]),
+      }
+      for i in top_idx.tolist()
+    ]
 
-    herfindahl = float(((holdings["weight"]) ** 2).sum())
+    # Equivalent to sum(weight**2) without materializing the squared array.
+    herfindahl = float((values @ values) / (total * total))
 
-    logger.info("Computed allocation across {} asset classes", len(allocation))
+    logger.debug("Computed allocation across {} asset classes", len(classes))
 
     return {
       "weights": weights,
@@ -55,18 +87,20 @@ class ConsumerAnalyticsAgent:
       "herfindahl_index": herfindahl,
     }
 
-  def run_stress_tests(self, holdings: pd.DataFrame) -> List[Dict[str, Any]]:
+  def run_stress_tests(self, holdings: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
     scenarios = []
+    values = holdings["value"]
+    classes, codes = np.unique(holdings["asset_class"], return_inverse=True)
+    current_value = float(values.sum())
+
     for name, scenario in self.blueprint.get("stress_tests", {}).items():
       shocks = scenario.get("shocks", {})
-      shocked_values = []
-      for _, row in holdings.iterrows():
-        shock = shocks.get(row["asset_class"], shocks.get("default", 0.0))
-        shocked_values.append(row["value"] * (1 + shock))
-
-      scenario_value = sum(shocked_values)
-      current_value = holdings["value"].sum()
-      pnl = scenario_value - current_value
+      default = shocks.get("default", 0.0)
+      class_shocks = np.fromiter(
+        (shocks.get(c, default) for c in classes.tolist()), dtype=np.float64, count=len(classes)
+      )
+
+      pnl = float((values * class_shocks[codes]).sum())
       pnl_pct = pnl / current_value if current_value != 0 else 0.0
 
       scenarios.append(
@@ -78,56 +112,72 @@ class ConsumerAnalyticsAgent:
         }
       )
 
-    logger.info("Ran {} consumer stress tests", len(scenarios))
+    logger.debug("Ran {} consumer stress tests", len(scenarios))
     return scenarios
 
-  def project_growth(self, holdings: pd.DataFrame, months: int = 12) -> List[Dict[str, Any]]:
+  def project_growth(self, holdings: Dict[str, np.ndarray], months: int = 12) -> List[Dict[str, Any]]:
     expected_returns = self.blueprint.get("expected_returns", {})
     monthly_contribution = self.blueprint.get("action_templates", {}).get("monthly_contribution", 0)
-    projection = []
 
-    total = holdings["value"].sum()
-    for month in range(1, months + 1):
-      monthly_return = 0.0
-      for _, row in holdings.iterrows():
-        asset_return = expected_returns.get(row["asset_class"], 0.0)
-        monthly_return += row["weight"] * (asset_return / 12)
+    classes, codes = np.unique(holdings["asset_class"], return_inverse=True)
+    class_returns = np.fromiter(
+      (expected_returns.get(c, 0.0) for c in classes.tolist()), dtype=np.float64, count=len(classes)
+    )
+    monthly_return = float((holdings["weight"] * class_returns[codes]).sum()) / 12.0
+    factor = 1 + monthly_return
 
-      total = total * (1 + monthly_return) + monthly_contribution
-      projection.append({"month": month, "projected_value": total})
+    total = float(holdings["value"].sum())
+    totals = project_compounded(total, factor, float(monthly_contribution), months)
+    projection = [
+      {"month": month, "projected_value": value}
+      for month, value in enumerate(totals.tolist(), start=1)
+    ]
 
-    logger.info("Built {}-month projection for consumer portfolio", months)
+    logger.debug("Built {}-month projection for consumer portfolio", months)
     return projection
 
 
 class ConsumerActionAgent:
+  __slots__ = ("blueprint", "_targets", "_threshold", "_max_single", "_notes")
+
+  _REBAL_TMPL = "{direction} approximately ${dollar:,.0f} in {asset_class} to move toward {target:.0%} target."
+  _CONC_TMPL = "Reduce {symbol} which is {weight:.1%} of the portfolio (above {limit:.0%} limit)."
+
   def __init__(self, blueprint: Dict[str, Any]):
     self.blueprint = blueprint
+    # Hoist the hot blueprint sub-dicts once; the action methods are called
+    # per build() and shouldn't re-traverse nested .get() chains.
+    templates = blueprint.get("action_templates", {})
+    self._targets = blueprint.get("policy_targets", {})
+    self._threshold = templates.get("rebalance_threshold", 0.0)
+    self._max_single = templates.get("max_single_position", 1.0)
+    self._notes = templates.get("notes", [])
 
   def generate_rebalance_actions(self, allocation: Dict[str, float], total_value: float) -> List[str]:
-    targets = self.blueprint.get("policy_targets", {})
-    threshold = self.blueprint.get("action_templates", {}).get("rebalance_threshold", 0.0)
+    threshold = self._threshold
     actions: List[str] = []
 
-    for asset_class, target in targets.items():
+    for asset_class, target in self._targets.items():
       current = allocation.get(asset_class, 0.0)
       drift = current - target
       if abs(drift) >= threshold:
         direction = "Trim" if drift > 0 else "Add"
         dollar = abs(drift) * total_value
         actions.append(
-          f"{direction} approximately ${dollar:,.0f} in {asset_class} to move toward {target:.0%} target."
+          self._REBAL_TMPL.format(
+            direction=direction, dollar=dollar, asset_class=asset_class, target=target
+          )
         )
 
     return actions
 
   def generate_concentration_actions(self, top_positions: List[Dict[str, Any]]) -> List[str]:
-    max_single = self.blueprint.get("action_templates", {}).get("max_single_position", 1.0)
+    max_single = self._max_single
     actions: List[str] = []
     for pos in top_positions:
       if pos["weight"] > max_single:
         actions.append(
-          f"Reduce {pos['symbol']} which is {pos['weight']:.1%} of the portfolio (above {max_single:.0%} limit)."
+          self._CONC_TMPL.format(symbol=pos["symbol"], weight=pos["weight"], limit=max_single)
         )
     return actions
 
@@ -135,16 +185,25 @@ class ConsumerActionAgent:
     actions = []
     actions.extend(self.generate_rebalance_actions(allocation, total_value))
     actions.extend(self.generate_concentration_actions(analytics.get("top_positions", [])))
-    actions.extend(self.blueprint.get("action_templates", {}).get("notes", []))
+    actions.extend(self._notes)
     return actions
 
 
 class ConsumerApplicationAgent:
+  __slots__ = ("blueprint", "_app_targets", "_delivery_plan", "_delivery_md")
+
   def __init__(self, blueprint: Dict[str, Any]):
     self.blueprint = blueprint
+    self._app_targets = blueprint.get("application_targets", {})
+    # The delivery plan is a pure function of the blueprint, so derive it once
+    # here rather than on every assemble_blueprint call. MappingProxyType keeps
+    # the shared copy read-only. The markdown rendering of the plan is equally
+    # static, so it is pre-rendered here too.
+    self._delivery_plan = MappingProxyType(self.derive_app_delivery_plan())
+    self._delivery_md = self._render_delivery(self._delivery_plan)
 
   def derive_app_delivery_plan(self) -> Dict[str, Any]:
-    targets = self.blueprint.get("application_targets", {})
+    targets = self._app_targets
 
     ios_plan = {
       "app_name": targets.get("ios", {}).get("app_name", ""),
@@ -174,7 +233,7 @@ class ConsumerApplicationAgent:
 
   def assemble_blueprint(self, as_of: date, data_state: Dict[str, Any], analytics: Dict[str, Any], projection: List[Dict[str, Any]], stress_tests: List[Dict[str, Any]], actions: List[str]) -> Dict[str, Any]:
     profile = data_state.get("profile", {})
-    delivery_plan = self.derive_app_delivery_plan()
+    delivery_plan = self._delivery_plan
 
     return {
       "as_of": str(as_of),
@@ -214,108 +273,131 @@ class ConsumerApplicationAgent:
         lines.append(f"- Objective: {profile['objective']}")
       lines.append("")
 
-    lines.append("## Portfolio Snapshot")
-    lines.append(f"- Total value: ${app_blueprint['portfolio'].get('total_value', 0):,.0f}")
-    lines.append("- Allocation by asset class:")
-    for asset_class, weight in app_blueprint["portfolio"].get("weights", {}).items():
-      lines.append(f"  - {asset_class}: {weight:.1%}")
-    lines.append("")
-
-    lines.append("### Top Positions")
-    for pos in app_blueprint["portfolio"].get("top_positions", []):
-      lines.append(f"- {pos['symbol']}: {pos['weight']:.1%} of portfolio (${pos['value']:,.0f})")
-    lines.append("")
-
-    lines.append("## Scenario Diagnostics")
-    lines.append(f"- Herfindahl concentration index: {app_blueprint['analytics'].get('herfindahl_index'):.3f}")
-    lines.append("")
-    lines.append("### Stress Tests")
-    for scenario in app_blueprint["analytics"].get("stress_tests", []):
-      lines.append(
-        f"- {scenario['name']}: {scenario.get('description', '')} | P&L: ${scenario['pnl']:,.0f} ({scenario['pnl_pct']:.1%})"
+    portfolio = app_blueprint["portfolio"]
+    analytics = app_blueprint["analytics"]
+
+    lines.extend(
+      (
+        "## Portfolio Snapshot",
+        f"- Total value: ${portfolio.get('total_value', 0):,.0f}",
+        "- Allocation by asset class:",
       )
-    lines.append("")
+    )
+    lines.extend(f"  - {asset_class}: {weight:.1%}" for asset_class, weight in portfolio.get("weights", {}).items())
+
+    # Format percentages and dollar amounts in dedicated passes over plain
+    # Python floats, then zip the pre-formatted strings into the line template.
+    top_positions = portfolio.get("top_positions", [])
+    top_pcts = [f"{pos['weight']:.1%}" for pos in top_positions]
+    top_values = [f"${pos['value']:,.0f}" for pos in top_positions]
+
+    lines.extend(("", "### Top Positions"))
+    lines.extend(
+      f"- {pos['symbol']}: {pct} of portfolio ({value})"
+      for pos, pct, value in zip(top_positions, top_pcts, top_values)
+    )
+
+    lines.extend(
+      (
+        "",
+        "## Scenario Diagnostics",
+        f"- Herfindahl concentration index: {analytics.get('herfindahl_index'):.3f}",
+        "",
+        "### Stress Tests",
+      )
+    )
+    lines.extend(
+      f"- {scenario['name']}: {scenario.get('description', '')} | P&L: ${scenario['pnl']:,.0f} ({scenario['pnl_pct']:.1%})"
+      for scenario in analytics.get("stress_tests", [])
+    )
 
-    lines.append("### 12-Month Projection")
-    for point in app_blueprint["analytics"].get("projection", []):
-      lines.append(f"- Month {point['month']}: ${point['projected_value']:,.0f}")
-    lines.append("")
+    projection = analytics.get("projection", [])
+    projected_values = [f"${point['projected_value']:,.0f}" for point in projection]
 
-    lines.append("## Action Plan")
-    for action in app_blueprint.get("actions", []):
-      lines.append(f"- {action}")
-    lines.append("")
+    lines.extend(("", "### 12-Month Projection"))
+    lines.extend(
+      f"- Month {point['month']}: {value}" for point, value in zip(projection, projected_values)
+    )
+
+    lines.extend(("", "## Action Plan"))
+    lines.extend(f"- {action}" for action in app_blueprint.get("actions", []))
+
+    lines.extend(("", "## Application Modules"))
+    lines.extend(f"- {module}" for module in app_blueprint.get("modules", []))
 
-    lines.append("## Application Modules")
-    for module in app_blueprint.get("modules", []):
-      lines.append(f"- {module}")
+    if self._delivery_md:
+      lines.extend(("", self._delivery_md))
 
-    delivery = app_blueprint.get("app_delivery", {})
-    if any(delivery.values()):
+    return "\n".join(lines)
+
+  @staticmethod
+  def _render_delivery(delivery: Dict[str, Any]) -> str:
+    if not any(delivery.values()):
+      return ""
+
+    lines: List[str] = ["## App Delivery Plan"]
+
+    ios_plan = delivery.get("ios", {})
+    if ios_plan:
+      lines.append("### iOS Experience")
+      if ios_plan.get("app_name"):
+        lines.append(f"- App name: {ios_plan['app_name']}")
+      if ios_plan.get("primary_flows"):
+        lines.append("- Primary flows:")
+        for flow in ios_plan["primary_flows"]:
+          lines.append(f"  - {flow}")
+      if ios_plan.get("widgets"):
+        lines.append("- Widgets/notifications:")
+        for widget in ios_plan["widgets"]:
+          lines.append(f"  - {widget}")
+      if ios_plan.get("ci_cd"):
+        lines.append("- Delivery pipeline:")
+        for step in ios_plan["ci_cd"]:
+          lines.append(f"  - {step}")
+
+    backend_plan = delivery.get("backend", {})
+    if backend_plan:
+      lines.append("")
+      lines.append("### Backend & Data")
+      if backend_plan.get("hosting"):
+        lines.append(f"- Hosting: {backend_plan['hosting']}")
+      if backend_plan.get("services"):
+        lines.append("- Services:")
+        for service in backend_plan["services"]:
+          name = service.get("name")
+          description = service.get("description", "")
+          stack = service.get("stack", "")
+          line = f"  - {name}: {description}" if description else f"  - {name}"
+          if stack:
+            line += f" | Stack: {stack}"
+          lines.append(line)
+      if backend_plan.get("api_contracts"):
+        lines.append("- API contracts:")
+        for api in backend_plan["api_contracts"]:
+          method = api.get("method", "GET")
+          path = api.get("path", "")
+          purpose = api.get("purpose", "")
+          response = api.get("response", "")
+          lines.append(f"  - {method} {path} – {purpose} | Response: {response}")
+      if backend_plan.get("data_schema"):
+        lines.append("- Data schema:")
+        for table, fields in backend_plan["data_schema"].items():
+          lines.append(f"  - {table}:")
+          for field in fields:
+            lines.append(f"    - {field}")
+
+    web_plan = delivery.get("web", {})
+    if web_plan:
       lines.append("")
-      lines.append("## App Delivery Plan")
-
-      ios_plan = delivery.get("ios", {})
-      if ios_plan:
-        lines.append("### iOS Experience")
-        if ios_plan.get("app_name"):
-          lines.append(f"- App name: {ios_plan['app_name']}")
-        if ios_plan.get("primary_flows"):
-          lines.append("- Primary flows:")
-          for flow in ios_plan["primary_flows"]:
-            lines.append(f"  - {flow}")
-        if ios_plan.get("widgets"):
-          lines.append("- Widgets/notifications:")
-          for widget in ios_plan["widgets"]:
-            lines.append(f"  - {widget}")
-        if ios_plan.get("ci_cd"):
-          lines.append("- Delivery pipeline:")
-          for step in ios_plan["ci_cd"]:
-            lines.append(f"  - {step}")
-
-      backend_plan = delivery.get("backend", {})
-      if backend_plan:
-        lines.append("")
-        lines.append("### Backend & Data")
-        if backend_plan.get("hosting"):
-          lines.append(f"- Hosting: {backend_plan['hosting']}")
-        if backend_plan.get("services"):
-          lines.append("- Services:")
-          for service in backend_plan["services"]:
-            name = service.get("name")
-            description = service.get("description", "")
-            stack = service.get("stack", "")
-            line = f"  - {name}: {description}" if description else f"  - {name}"
-            if stack:
-              line += f" | Stack: {stack}"
-            lines.append(line)
-        if backend_plan.get("api_contracts"):
-          lines.append("- API contracts:")
-          for api in backend_plan["api_contracts"]:
-            method = api.get("method", "GET")
-            path = api.get("path", "")
-            purpose = api.get("purpose", "")
-            response = api.get("response", "")
-            lines.append(f"  - {method} {path} – {purpose} | Response: {response}")
-        if backend_plan.get("data_schema"):
-          lines.append("- Data schema:")
-          for table, fields in backend_plan["data_schema"].items():
-            lines.append(f"  - {table}:")
-            for field in fields:
-              lines.append(f"    - {field}")
-
-      web_plan = delivery.get("web", {})
-      if web_plan:
-        lines.append("")
-        lines.append("### Web Experience")
-        if web_plan.get("url"):
-          lines.append(f"- URL: {web_plan['url']}")
-        if web_plan.get("auth"):
-          lines.append(f"- Auth: {web_plan['auth']}")
-        if web_plan.get("pages"):
-          lines.append("- Pages:")
-          for page in web_plan["pages"]:
-            lines.append(f"  - {page}")
+      lines.append("### Web Experience")
+      if web_plan.get("url"):
+        lines.append(f"- URL: {web_plan['url']}")
+      if web_plan.get("auth"):
+        lines.append(f"- Auth: {web_plan['auth']}")
+      if web_plan.get("pages"):
+        lines.append("- Pages:")
+        for page in web_plan["pages"]:
+          lines.append(f"  - {page}")
 
     return "\n".join(lines)
 
@@ -323,15 +405,14 @@ class ConsumerApplicationAgent:
 class ConsumerQuantFramework:
   def __init__(self, config: ConsumerFrameworkConfig):
     self.config = config
-    with open(config.blueprint_path, "r", encoding="utf-8") as f:
-      self.blueprint = yaml.safe_load(f)
+    self.blueprint = load_yaml(config.blueprint_path)
 
     self.data_agent = ConsumerDataAgent(self.blueprint)
     self.analytics_agent = ConsumerAnalyticsAgent(self.blueprint)
     self.action_agent = ConsumerActionAgent(self.blueprint)
     self.application_agent = ConsumerApplicationAgent(self.blueprint)
 
-    self.config.output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(self.config.output_dir)
 
   def build(self, as_of: date) -> Path:
     data_state = self.data_agent.load_portfolio()
@@ -351,7 +432,9 @@ class ConsumerQuantFramework:
 
     markdown = self.application_agent.to_markdown(app_blueprint)
     output_path = self.config.output_dir / f"consumer_quant_blueprint_{as_of}.md"
-    output_path.write_text(markdown, encoding="utf-8")
+    # Encode once and write the raw bytes, bypassing the TextIOWrapper's
+    # incremental encoding buffer.
+    output_path.write_bytes(markdown.encode("utf-8"))
 
     logger.info("Wrote consumer quant blueprint to {}", output_path)
     return output_path
@@ -2,10 +2,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Any
 from pathlib import Path
-import yaml
 from loguru import logger
 
 from src.tools.dashboard_io import write_dashboard_feeds
+from src.tools.yaml_cache import load_yaml
 
 
 @dataclass
@@ -16,8 +16,7 @@ class DashboardAgentConfig:
 class DashboardAgent:
   def __init__(self, config: DashboardAgentConfig):
     self.config = config
-    with open(config.dashboards_config_path, "r") as f:
-      self._cfg = yaml.safe_load(f)
+    self._cfg = load_yaml(config.dashboards_config_path)
 
   def publish_daily_feeds(self, data_bundle: Dict[str, Any], model_results: Dict[str, Any]) -> None:
     logger.info("Publishing daily dashboard feeds")
@@ -1,12 +1,18 @@
 from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Any
 from loguru import logger
-import yaml
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from src.tools.snowflake_io import SnowflakeClient
 from src.tools.price_return_engine import compute_standard_returns
+from src.tools.yaml_cache import load_yaml
 
 
 @dataclass
@@ -17,9 +23,13 @@ class DataAgentConfig:
 class DataAgent:
   def __init__(self, config: DataAgentConfig):
     self.config = config
-    with open(config.datasources_path, "r") as f:
-      self._cfg = yaml.safe_load(f)
-    self._snowflake_client = SnowflakeClient.from_env(self._cfg["connections"]["snowflake"])
+    self._cfg = load_yaml(config.datasources_path)
+
+  @cached_property
+  def _snowflake_client(self) -> SnowflakeClient:
+    # Deferred until the first fetch so constructing the agent (e.g. for
+    # pipelines that never load returns) skips the Snowflake auth round trip.
+    return SnowflakeClient.from_env(self._cfg["connections"]["snowflake"])
 
   def load_cross_asset_returns(self, as_of_date) -> Dict[str, Any]:
     """
@@ -30,33 +40,90 @@ class DataAgent:
     benchmarks_cfg = self._cfg["benchmarks"]
 
     raw_frames = {}
-    for asset_class, meta in benchmarks_cfg.items():
-      universe = meta["universe"]
-      raw_frames[asset_class] = self._snowflake_client.fetch_benchmark_returns(
-        universe=universe,
-        as_of_date=as_of_date,
-        frequency=meta["frequency"],
+    with ThreadPoolExecutor(max_workers=min(8, len(benchmarks_cfg))) as executor:
+      futures = {
+        executor.submit(
+          self._snowflake_client.fetch_benchmark_returns,
+          universe=meta["universe"],
+          as_of_date=as_of_date,
+          frequency=meta["frequency"],
+        ): asset_class
+        for asset_class, meta in benchmarks_cfg.items()
+      }
+      for future in as_completed(futures):
+        raw_frames[futures[future]] = future.result()
+
+    standardized = compute_standard_returns(raw_frames)
+    diagnostics_df = self._compute_data_diagnostics(standardized, benchmarks_cfg)
+
+    return {
+      "raw": raw_frames,
+      "standardized": standardized,
+      "diagnostics": self._diagnostics_dict(diagnostics_df),
+      "diagnostics_df": diagnostics_df,
+    }
+
+  async def load_cross_asset_returns_async(self, as_of_date) -> Dict[str, Any]:
+    """
+    Async variant of load_cross_asset_returns for callers already running an
+    event loop; benchmark fetches for all asset classes are gathered
+    concurrently.
+    """
+    logger.info(f"Loading cross-asset returns for {as_of_date}")
+    benchmarks_cfg = self._cfg["benchmarks"]
+
+    asset_classes = list(benchmarks_cfg)
+    frames = await asyncio.gather(
+      *(
+        self._snowflake_client.fetch_benchmark_returns_async(
+          universe=benchmarks_cfg[asset_class]["universe"],
+          as_of_date=as_of_date,
+          frequency=benchmarks_cfg[asset_class]["frequency"],
+        )
+        for asset_class in asset_classes
       )
+    )
+    raw_frames = dict(zip(asset_classes, frames))
 
     standardized = compute_standard_returns(raw_frames)
-    diagnostics = self._compute_data_diagnostics(standardized, benchmarks_cfg)
+    diagnostics_df = self._compute_data_diagnostics(standardized, benchmarks_cfg)
 
     return {
       "raw": raw_frames,
       "standardized": standardized,
-      "diagnostics": diagnostics,
+      "diagnostics": self._diagnostics_dict(diagnostics_df),
+      "diagnostics_df": diagnostics_df,
     }
 
   @staticmethod
-  def _compute_data_diagnostics(standardized: Dict[str, Any], benchmarks_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    diagnostics = {}
-    for asset_class, df in standardized.items():
-      expected = len(benchmarks_cfg[asset_class]["universe"])
-      actual = df["BENCHMARK_ID"].nunique() if not df.empty else 0
-      coverage = actual / expected if expected > 0 else 1.0
-      diagnostics[asset_class] = {
-        "expected": expected,
-        "actual": actual,
+  def _compute_data_diagnostics(standardized: pd.DataFrame, benchmarks_cfg: Dict[str, Any]) -> pd.DataFrame:
+    """Coverage per asset class as one frame with columns [asset_class, coverage, actual, expected]."""
+    if standardized.empty:
+      counts: Dict[str, int] = {}
+    else:
+      # One cython groupby pass over the long-form frame covers every asset
+      # class; the categorical ASSET_CLASS column uses the dedicated hash path.
+      counts = (
+        standardized.groupby("ASSET_CLASS", observed=True)["BENCHMARK_ID"].nunique().to_dict()
+      )
+
+    asset_classes = list(benchmarks_cfg)
+    expected = np.fromiter((len(benchmarks_cfg[ac]["universe"]) for ac in asset_classes), dtype=np.int64)
+    actual = np.fromiter((counts.get(ac, 0) for ac in asset_classes), dtype=np.int64)
+    coverage = np.divide(actual, expected, out=np.ones(len(expected)), where=expected > 0)
+    return pd.DataFrame(
+      {
+        "asset_class": asset_classes,
         "coverage": coverage,
+        "actual": actual,
+        "expected": expected,
       }
-    return diagnostics
+    )
+
+  @staticmethod
+  def _diagnostics_dict(diagnostics_df: pd.DataFrame) -> Dict[str, Any]:
+    """Per-asset-class dict view kept for downstream consumers of the bundle."""
+    return {
+      row.asset_class: {"expected": int(row.expected), "actual": int(row.actual), "coverage": float(row.coverage)}
+      for row in diagnostics_df.itertuples(index=False)
+    }
@@ -1,9 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date
+import asyncio
 import os
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from loguru import logger
 
 
@@ -21,6 +23,17 @@ class GitHubAgent:
       logger.warning("No GitHub token found; GitHub integration will be disabled.")
     self._token = token
 
+    # One pooled session per agent: keep-alive avoids a fresh TCP+TLS
+    # handshake per API call, and transient API errors are retried.
+    self._session = requests.Session()
+    self._session.headers.update(self._headers())
+    adapter = HTTPAdapter(
+      pool_connections=2,
+      pool_maxsize=8,
+      max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    self._session.mount("https://", adapter)
+
   def _headers(self) -> dict:
     return {
       "Authorization": f"token {self._token}",
@@ -32,17 +45,60 @@ class GitHubAgent:
       return None
     logger.info(f"Creating GitHub issue: {title}")
     url = f"https://api.github.com/repos/{self.config.repo}/issues"
-    resp = requests.post(url, json={"title": title, "body": body}, headers=self._headers())
+    resp = self._session.post(url, json={"title": title, "body": body}, timeout=10)
     if resp.status_code != 201:
       logger.error(f"Failed to create issue: {resp.status_code} {resp.text}")
       return None
     return resp.json().get("number")
 
-  def log_data_quality_issue(self, as_of: date, asset_class: str, coverage: float) -> None:
+  @staticmethod
+  def _data_quality_payload(as_of: date, asset_class: str, coverage: float) -> Dict[str, str]:
     title = f"Data quality alert: {asset_class} coverage {coverage:.1%} on {as_of}"
     body = (
       f"Data coverage for {asset_class} fell below the threshold on {as_of}.\n\n"
       f"- Coverage: {coverage:.1%}\n\n"
       "Please review data ingestion and vendor feeds."
     )
-    self.create_issue(title, body)
+    return {"title": title, "body": body}
+
+  def log_data_quality_issue(self, as_of: date, asset_class: str, coverage: float) -> None:
+    payload = self._data_quality_payload(as_of, asset_class, coverage)
+    self.create_issue(payload["title"], payload["body"])
+
+  def log_data_quality_batch(self, as_of: date, issues: List[Tuple[str, float]]) -> None:
+    """File a single issue summarising every (asset_class, coverage) breach for the run."""
+    if not issues:
+      return
+    title = f"Data quality alert: {len(issues)} asset classes below coverage threshold on {as_of}"
+    lines = [
+      f"Data coverage fell below the threshold for the following asset classes on {as_of}.",
+      "",
+      "| Asset class | Coverage |",
+      "| --- | --- |",
+    ]
+    lines.extend(f"| {asset_class} | {coverage:.1%} |" for asset_class, coverage in issues)
+    lines.extend(["", "Please review data ingestion and vendor feeds."])
+    self.create_issue(title, "\n".join(lines))
+
+  async def log_many(self, items: List[Tuple[date, str, float]]) -> None:
+    """File one data-quality issue per (as_of, asset_class, coverage) item concurrently."""
+    if not self._token or not items:
+      return
+
+    try:
+      import httpx
+    except ImportError:
+      logger.warning("httpx not installed; filing data-quality issues sequentially.")
+      for as_of, asset_class, coverage in items:
+        self.log_data_quality_issue(as_of, asset_class, coverage)
+      return
+
+    logger.info(f"Filing {len(items)} data-quality issues concurrently")
+    url = f"https://api.github.com/repos/{self.config.repo}/issues"
+    async with httpx.AsyncClient(headers=self._headers(), timeout=10) as client:
+      responses = await asyncio.gather(
+        *(client.post(url, json=self._data_quality_payload(*item)) for item in items)
+      )
+    for resp in responses:
+      if resp.status_code != 201:
+        logger.error(f"Failed to create issue: {resp.status_code} {resp.text}")
@@ -2,11 +2,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Any
 from pathlib import Path
-import yaml
 from loguru import logger
 
 from src.tools.factor_timing_models import run_factor_timing_models
 from src.tools.saa_optimizer import run_saa_optimizer
+from src.tools.yaml_cache import load_yaml
 
 
 @dataclass
@@ -17,8 +17,7 @@ class ModelAgentConfig:
 class ModelAgent:
   def __init__(self, config: ModelAgentConfig):
     self.config = config
-    with open(config.models_config_path, "r") as f:
-      self._cfg = yaml.safe_load(f)
+    self._cfg = load_yaml(config.models_config_path)
 
   def run_models(self, data_bundle: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Running factor timing and SAA models")
@@ -2,11 +2,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+import functools
 
-import yaml
 from loguru import logger
 
+from src.tools.fs_utils import ensure_dir
+from src.tools.yaml_cache import load_yaml
+
 
 @dataclass
 class SnowflakeFrameworkConfig:
@@ -19,16 +22,30 @@ class SnowflakeSchemaAgent:
 
   def __init__(self, config: SnowflakeFrameworkConfig):
     self.config = config
-    with open(config.schema_path, "r", encoding="utf-8") as f:
-      self.schema_doc = yaml.safe_load(f)
+    self.schema_doc = load_yaml(config.schema_path)
+    self._described_tables: Optional[List[Dict[str, Any]]] = None
+
+    # Resolve the connection scope and fully qualified table names up front;
+    # fully_qualified_name is called for every table reference in every query.
+    self._connection = self.schema_doc.get("connection", {})
+    self._tables = self.schema_doc.get("tables", {})
+    database = self._connection.get("database", "").upper()
+    schema = self._connection.get("schema", "").upper()
+    self._fqn = {
+      slug: f"{database}.{schema}.{meta.get('name', slug)}" for slug, meta in self._tables.items()
+    }
+    self._fqn_prefix = f"{database}.{schema}."
 
   def connection_profile(self) -> Dict[str, Any]:
-    return self.schema_doc.get("connection", {})
+    return self._connection
 
   def tables(self) -> Dict[str, Dict[str, Any]]:
-    return self.schema_doc.get("tables", {})
+    return self._tables
 
   def describe_tables(self) -> List[Dict[str, Any]]:
+    if self._described_tables is not None:
+      return self._described_tables
+
     tables = []
     for name, meta in self.tables().items():
       tables.append(
@@ -42,46 +59,44 @@ class SnowflakeSchemaAgent:
         }
       )
     logger.info("Loaded {} Snowflake tables from schema", len(tables))
+    self._described_tables = tables
     return tables
 
   def fully_qualified_name(self, table_slug: str) -> str:
-    tables = self.tables()
-    meta = tables.get(table_slug, {})
-    name = meta.get("name", table_slug)
-    conn = self.connection_profile()
-    database = conn.get("database", "").upper()
-    schema = conn.get("schema", "").upper()
-    return f"{database}.{schema}.{name}"
-
-
-class SnowflakeQueryAgent:
-  """Generate reusable SQL snippets and dashboards from the provided schema."""
+    fqn = self._fqn.get(table_slug)
+    if fqn is None:
+      fqn = self._fqn_prefix + table_slug
+    return fqn
 
-  def __init__(self, schema_agent: SnowflakeSchemaAgent):
-    self.schema_agent = schema_agent
 
-  def _table(self, slug: str) -> str:
-    return self.schema_agent.fully_qualified_name(slug)
+_QUERY_TABLE_SLUGS = (
+  "benchmark_returns",
+  "benchmark_master",
+  "benchmark_returns_fx",
+  "benchmark_constituents",
+  "constituent_fundamentals",
+)
 
-  def build_queries(self) -> List[Dict[str, str]]:
-    queries = [
-      {
-        "name": "Benchmark coverage and freshness",
-        "purpose": "Check latest date per benchmark and ensure feed completeness.",
-        "sql": f"""
+# Static SQL templates with {table_slug} placeholders; qualified names are
+# substituted once per SnowflakeQueryAgent rather than per build_queries call.
+_QUERY_TEMPLATES: List[Dict[str, str]] = [
+  {
+    "name": "Benchmark coverage and freshness",
+    "purpose": "Check latest date per benchmark and ensure feed completeness.",
+    "sql": """
           SELECT
             benchmark_id,
             MAX(trade_date) AS latest_date,
             COUNT(*) AS rows_loaded
-          FROM {self._table('benchmark_returns')}
+          FROM {benchmark_returns}
           GROUP BY 1
           ORDER BY latest_date DESC;
-        """,
-      },
-      {
-        "name": "Daily performance with FX normalization",
-        "purpose": "Pull daily total return with currency conversion into a uniform base.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Daily performance with FX normalization",
+    "purpose": "Pull daily total return with currency conversion into a uniform base.",
+    "sql": """
           SELECT
             r.trade_date,
             r.benchmark_id,
@@ -89,22 +104,22 @@ class SnowflakeQueryAgent:
             r.total_return_local,
             r.fx_rate_to_usd,
             (r.total_return_local * COALESCE(r.fx_rate_to_usd, 1)) AS total_return_usd
-          FROM {self._table('benchmark_returns')} r
-          JOIN {self._table('benchmark_master')} m USING (benchmark_id)
+          FROM {benchmark_returns} r
+          JOIN {benchmark_master} m USING (benchmark_id)
           WHERE r.trade_date BETWEEN DATEADD(month, -12, CURRENT_DATE()) AND CURRENT_DATE()
           ORDER BY r.trade_date, r.benchmark_id;
-        """,
-      },
-      {
-        "name": "Monthly performance and drawdowns",
-        "purpose": "Resample to month-end, compute rolling return, and drawdown path for dashboards.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Monthly performance and drawdowns",
+    "purpose": "Resample to month-end, compute rolling return, and drawdown path for dashboards.",
+    "sql": """
           WITH monthlies AS (
             SELECT
               DATE_TRUNC('month', trade_date) AS month,
               benchmark_id,
               EXP(SUM(LN(1 + total_return_usd))) - 1 AS monthly_return
-            FROM {self._table('benchmark_returns_fx')}
+            FROM {benchmark_returns_fx}
             GROUP BY 1, 2
           ),
           nav_path AS (
@@ -119,12 +134,12 @@ class SnowflakeQueryAgent:
             cum_return - MAX(cum_return) OVER (PARTITION BY benchmark_id ORDER BY month ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS drawdown
           FROM nav_path
           ORDER BY month, benchmark_id;
-        """,
-      },
-      {
-        "name": "Constituent weights with sector and country tilt",
-        "purpose": "Surface benchmark composition for attribution tiles.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Constituent weights with sector and country tilt",
+    "purpose": "Surface benchmark composition for attribution tiles.",
+    "sql": """
           SELECT
             c.as_of_date,
             c.benchmark_id,
@@ -133,16 +148,16 @@ class SnowflakeQueryAgent:
             c.weight,
             c.sector,
             c.country
-          FROM {self._table('benchmark_constituents')} c
-          JOIN {self._table('benchmark_master')} m USING (benchmark_id)
-          WHERE c.as_of_date = (SELECT MAX(as_of_date) FROM {self._table('benchmark_constituents')})
+          FROM {benchmark_constituents} c
+          JOIN {benchmark_master} m USING (benchmark_id)
+          WHERE c.as_of_date = (SELECT MAX(as_of_date) FROM {benchmark_constituents})
           ORDER BY c.benchmark_id, c.weight DESC;
-        """,
-      },
-      {
-        "name": "Fundamental snapshot by benchmark",
-        "purpose": "Aggregate valuation and quality ratios using the latest constituent fundamentals.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Fundamental snapshot by benchmark",
+    "purpose": "Aggregate valuation and quality ratios using the latest constituent fundamentals.",
+    "sql": """
           WITH latest_fundamentals AS (
             SELECT
               f.ticker,
@@ -150,9 +165,9 @@ class SnowflakeQueryAgent:
               f.pe_ratio,
               f.pb_ratio,
               f.dividend_yield,
-              f.revenue_growth,
-              ROW_NUMBER() OVER (PARTITION BY f.ticker ORDER BY f.period_end_date DESC) AS rn
-            FROM {self._table('constituent_fundamentals')} f
+              f.revenue_growth
+            FROM {constituent_fundamentals} f
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY f.ticker ORDER BY f.period_end_date DESC) = 1
           )
           SELECT
             c.benchmark_id,
@@ -161,18 +176,28 @@ class SnowflakeQueryAgent:
             SUM(c.weight * lf.pb_ratio) AS weighted_pb,
             SUM(c.weight * lf.dividend_yield) AS weighted_dividend_yield,
             SUM(c.weight * lf.revenue_growth) AS weighted_revenue_growth
-          FROM {self._table('benchmark_constituents')} c
-          JOIN latest_fundamentals lf ON c.ticker = lf.ticker AND lf.rn = 1
-          JOIN {self._table('benchmark_master')} m USING (benchmark_id)
-          WHERE c.as_of_date = (SELECT MAX(as_of_date) FROM {self._table('benchmark_constituents')})
+          FROM {benchmark_constituents} c
+          JOIN latest_fundamentals lf ON c.ticker = lf.ticker
+          JOIN {benchmark_master} m USING (benchmark_id)
+          WHERE c.as_of_date = (SELECT MAX(as_of_date) FROM {benchmark_constituents})
           GROUP BY 1, 2
           ORDER BY benchmark_id;
-        """,
-      },
-      {
-        "name": "Attribution-ready joined fact table",
-        "purpose": "Produce a wide fact table combining returns, weights, and fundamentals for BI tools.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Attribution-ready joined fact table",
+    "purpose": "Produce a wide fact table combining returns, weights, and fundamentals for BI tools.",
+    "sql": """
+          WITH latest_fundamentals AS (
+            SELECT
+              f.ticker,
+              f.pe_ratio,
+              f.revenue_growth,
+              f.sector,
+              f.country
+            FROM {constituent_fundamentals} f
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY f.ticker ORDER BY f.period_end_date DESC) = 1
+          )
           SELECT
             r.trade_date,
             r.benchmark_id,
@@ -184,42 +209,60 @@ class SnowflakeQueryAgent:
             f.revenue_growth,
             f.sector,
             f.country
-          FROM {self._table('benchmark_returns_fx')} r
-          JOIN {self._table('benchmark_constituents')} c
+          FROM {benchmark_returns_fx} r
+          JOIN {benchmark_constituents} c
             ON r.benchmark_id = c.benchmark_id
             AND r.trade_date BETWEEN c.as_of_date AND COALESCE(c.next_rebalance_date, r.trade_date)
-          LEFT JOIN {self._table('constituent_fundamentals')} f ON c.ticker = f.ticker AND f.period_end_date = (
-            SELECT MAX(period_end_date) FROM {self._table('constituent_fundamentals')} f2 WHERE f2.ticker = f.ticker
-          )
-          JOIN {self._table('benchmark_master')} m USING (benchmark_id)
+          LEFT JOIN latest_fundamentals f ON c.ticker = f.ticker
+          JOIN {benchmark_master} m USING (benchmark_id)
           WHERE r.trade_date >= DATEADD(month, -6, CURRENT_DATE());
-        """,
-      },
-      {
-        "name": "Data quality checks",
-        "purpose": "Detect gaps, nulls, or outlier returns before publishing dashboards.",
-        "sql": f"""
+    """,
+  },
+  {
+    "name": "Data quality checks",
+    "purpose": "Detect gaps, nulls, or outlier returns before publishing dashboards.",
+    "sql": """
           SELECT
             'missing_constituent_weights' AS check_name,
             COUNT(*) AS issue_count
-          FROM {self._table('benchmark_constituents')}
+          FROM {benchmark_constituents}
           WHERE weight IS NULL OR weight <= 0
           UNION ALL
           SELECT 'extreme_returns', COUNT(*)
-          FROM {self._table('benchmark_returns_fx')}
+          FROM {benchmark_returns_fx}
           WHERE ABS(total_return_usd) > 0.3
           UNION ALL
           SELECT 'stale_fundamentals', COUNT(*)
-          FROM {self._table('constituent_fundamentals')}
+          FROM {constituent_fundamentals}
           WHERE period_end_date < DATEADD(month, -18, CURRENT_DATE());
-        """,
-      },
+    """,
+  },
+]
+
+
+class SnowflakeQueryAgent:
+  """Generate reusable SQL snippets and dashboards from the provided schema."""
+
+  def __init__(self, schema_agent: SnowflakeSchemaAgent):
+    self.schema_agent = schema_agent
+    # The schema never changes within a process, so the query library is
+    # rendered once here; dashboard ideas are cached after first use.
+    self._table = functools.lru_cache(maxsize=None)(self.schema_agent.fully_qualified_name)
+    table_map = {slug: self._table(slug) for slug in _QUERY_TABLE_SLUGS}
+    self._queries = [
+      {"name": t["name"], "purpose": t["purpose"], "sql": t["sql"].format_map(table_map)}
+      for t in _QUERY_TEMPLATES
     ]
+    self._dashboards: Optional[List[str]] = None
+    logger.info("Prepared {} Snowflake queries for the blueprint", len(self._queries))
 
-    logger.info("Prepared {} Snowflake queries for the blueprint", len(queries))
-    return queries
+  def build_queries(self) -> List[Dict[str, str]]:
+    return self._queries
 
   def dashboard_ideas(self) -> List[str]:
+    if self._dashboards is not None:
+      return self._dashboards
+
     ideas = [
       "Benchmark overview: 1M/3M/6M/1Y returns, drawdown sparkline, latest price vs. SMA.",
       "Composition: top 10 constituents, sector and country treemaps, weight drift vs. target.",
@@ -228,6 +271,7 @@ class SnowflakeQueryAgent:
       "Data health: feed freshness by benchmark, null/zero weight checks, extreme return monitors.",
     ]
     logger.info("Enumerated {} dashboard ideas", len(ideas))
+    self._dashboards = ideas
     return ideas
 
 
@@ -275,27 +319,28 @@ class SnowflakeBlueprintWriter:
         lines.append(f"- Grain: {table['grain']}")
       if table.get("primary_keys"):
         lines.append("- Primary keys:")
-        for key in table["primary_keys"]:
-          lines.append(f"  - {key}")
+        lines.extend("  - " + key for key in table["primary_keys"])
       if table.get("columns"):
         lines.append("- Columns:")
-        for column in table["columns"]:
-          lines.append(f"  - {column}")
+        lines.extend("  - " + column for column in table["columns"])
       lines.append("")
 
     lines.append("## Query library")
     for query in blueprint.get("queries", []):
-      lines.append(f"### {query['name']}")
-      lines.append(f"Purpose: {query['purpose']}")
-      lines.append("")
-      lines.append("```sql")
-      lines.append(query["sql"].strip())
-      lines.append("```")
-      lines.append("")
+      lines.extend(
+        (
+          f"### {query['name']}",
+          f"Purpose: {query['purpose']}",
+          "",
+          "```sql",
+          query["sql"].strip(),
+          "```",
+          "",
+        )
+      )
 
     lines.append("## Dashboard starters")
-    for idea in blueprint.get("dashboards", []):
-      lines.append(f"- {idea}")
+    lines.extend(f"- {idea}" for idea in blueprint.get("dashboards", []))
 
     return "\n".join(lines)
 
@@ -306,12 +351,13 @@ class SnowflakeAnalyticsFramework:
     self.schema_agent = SnowflakeSchemaAgent(config)
     self.query_agent = SnowflakeQueryAgent(self.schema_agent)
     self.writer = SnowflakeBlueprintWriter(self.schema_agent, self.query_agent)
-    self.config.output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(self.config.output_dir)
 
   def build(self, as_of: date) -> Path:
     blueprint = self.writer.build(as_of=as_of)
     markdown = self.writer.to_markdown(blueprint)
     output_path = self.config.output_dir / f"snowflake_benchmark_blueprint_{as_of}.md"
-    output_path.write_text(markdown, encoding="utf-8")
+    # Encode once and write raw bytes, matching the consumer blueprint writer.
+    output_path.write_bytes(markdown.encode("utf-8"))
     logger.info("Wrote Snowflake benchmark blueprint to {}", output_path)
     return output_path
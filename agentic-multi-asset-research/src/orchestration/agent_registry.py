@@ -0,0 +1,28 @@
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+
+from src.agents.data_agent import DataAgent, DataAgentConfig
+from src.agents.model_agent import ModelAgent, ModelAgentConfig
+from src.agents.insight_agent import InsightAgent, InsightAgentConfig
+from src.agents.dashboard_agent import DashboardAgent, DashboardAgentConfig
+
+
+@lru_cache(maxsize=None)
+def get_data_agent(datasources_path: Path) -> DataAgent:
+  return DataAgent(DataAgentConfig(datasources_path=datasources_path))
+
+
+@lru_cache(maxsize=None)
+def get_model_agent(models_config_path: Path) -> ModelAgent:
+  return ModelAgent(ModelAgentConfig(models_config_path=models_config_path))
+
+
+@lru_cache(maxsize=None)
+def get_insight_agent(output_dir: Path) -> InsightAgent:
+  return InsightAgent(InsightAgentConfig(output_dir=output_dir))
+
+
+@lru_cache(maxsize=None)
+def get_dashboard_agent(dashboards_config_path: Path) -> DashboardAgent:
+  return DashboardAgent(DashboardAgentConfig(dashboards_config_path=dashboards_config_path))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import argparse
-from datetime import datetime, date
+import functools
+from datetime import date
 from pathlib import Path
 from loguru import logger
 
@@ -11,7 +12,8 @@ from src.pipelines.monthly_saa_review import run_monthly
 from src.pipelines.weekly_factor_deepdive import run_weekly
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
   parser = argparse.ArgumentParser(description="Agentic multi-asset research runner")
   parser.add_argument(
     "--pipeline",
@@ -37,12 +39,16 @@ def parse_args() -> argparse.Namespace:
     default=None,
     help='GitHub repo in "owner/name" format, e.g. "user/agentic-multi-asset-research"',
   )
-  return parser.parse_args()
+  return parser
+
+
+def parse_args() -> argparse.Namespace:
+  return _build_parser().parse_args()
 
 
 def main() -> None:
   args = parse_args()
-  as_of = date.today() if args.as_of is None else datetime.strptime(args.as_of, "%Y-%m-%d").date()
+  as_of = date.today() if args.as_of is None else date.fromisoformat(args.as_of)
   repo_root = Path(args.repo_root or ".").resolve()
 
   logger.info(f"Running pipeline={args.pipeline} as_of={as_of} repo_root={repo_root}")
@@ -1,26 +1,34 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
-from src.agents.data_agent import DataAgent, DataAgentConfig
-from src.agents.model_agent import ModelAgent, ModelAgentConfig
-from src.agents.insight_agent import InsightAgent, InsightAgentConfig
-from src.agents.dashboard_agent import DashboardAgent, DashboardAgentConfig
+from src.orchestration.agent_registry import (
+  get_dashboard_agent,
+  get_data_agent,
+  get_insight_agent,
+  get_model_agent,
+)
 
 
 def run_monthly(as_of: date, repo_root: Path) -> None:
   config_dir = repo_root / "config"
   reports_dir = repo_root / "reports" / "monthly"
 
-  data_agent = DataAgent(DataAgentConfig(datasources_path=config_dir / "datasources.yaml"))
-  model_agent = ModelAgent(ModelAgentConfig(models_config_path=config_dir / "models.yaml"))
-  insight_agent = InsightAgent(InsightAgentConfig(output_dir=reports_dir))
-  dashboard_agent = DashboardAgent(DashboardAgentConfig(dashboards_config_path=config_dir / "dashboards.yaml"))
+  data_agent = get_data_agent(config_dir / "datasources.yaml")
+  model_agent = get_model_agent(config_dir / "models.yaml")
+  insight_agent = get_insight_agent(reports_dir)
+  dashboard_agent = get_dashboard_agent(config_dir / "dashboards.yaml")
 
   data_bundle = data_agent.load_cross_asset_returns(as_of_date=as_of)
   model_results = model_agent.run_models(data_bundle)
 
-  summary_path = insight_agent.create_daily_summary(as_of=as_of, data_bundle=data_bundle, model_results=model_results)
-  dashboard_agent.publish_monthly_feeds(data_bundle, model_results)
+  with ThreadPoolExecutor(max_workers=2) as pool:
+    summary_future = pool.submit(
+      insight_agent.create_daily_summary, as_of=as_of, data_bundle=data_bundle, model_results=model_results
+    )
+    feeds_future = pool.submit(dashboard_agent.publish_monthly_feeds, data_bundle, model_results)
+    summary_path = summary_future.result()
+    feeds_future.result()
 
   print(f"Monthly SAA review written to {summary_path}")
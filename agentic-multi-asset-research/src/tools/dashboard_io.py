@@ -1,25 +1,43 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from pathlib import Path
 import json
 from loguru import logger
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
 
-def write_dashboard_feeds(cfg: Dict[str, Any], data_bundle: Dict[str, Any], model_results: Dict[str, Any]) -> None:
-  outputs = cfg.get("outputs", [])
-  for output in outputs:
-    file_path = Path(output["file"])
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Writing dashboard feed: {file_path}")
-    payload = {
-      "meta": {
-        "description": output.get("description", ""),
-      },
-      "data": {
-        "diagnostics": data_bundle.get("diagnostics", {}),
-        "factor_timing": model_results.get("factor_timing", {}),
-        "saa": model_results.get("saa", {}),
-      },
-    }
+
+def _write_feed(output: Dict[str, Any], data_bundle: Dict[str, Any], model_results: Dict[str, Any]) -> None:
+  file_path = Path(output["file"])
+  file_path.parent.mkdir(parents=True, exist_ok=True)
+  logger.info(f"Writing dashboard feed: {file_path}")
+  payload = {
+    "meta": {
+      "description": output.get("description", ""),
+    },
+    "data": {
+      "diagnostics": data_bundle.get("diagnostics", {}),
+      "factor_timing": model_results.get("factor_timing", {}),
+      "saa": model_results.get("saa", {}),
+    },
+  }
+  if orjson is not None:
+    # C serializer plus a single raw-bytes write; handles numpy values too.
+    file_path.write_bytes(orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+  else:
     with open(file_path, "w", encoding="utf-8") as f:
       json.dump(payload, f, default=str)
+
+
+def write_dashboard_feeds(cfg: Dict[str, Any], data_bundle: Dict[str, Any], model_results: Dict[str, Any]) -> None:
+  outputs = cfg.get("outputs", [])
+  if not outputs:
+    return
+  # Each feed is an independent file write, so overlap the disk I/O.
+  with ThreadPoolExecutor(max_workers=min(4, len(outputs))) as pool:
+    for future in [pool.submit(_write_feed, output, data_bundle, model_results) for output in outputs]:
+      future.result()
@@ -3,17 +3,23 @@ from typing import Dict, Any
 import pandas as pd
 
 
-def run_factor_timing_models(standardized_returns: Dict[str, pd.DataFrame], config: Dict[str, Any]) -> Dict[str, Any]:
-  """Placeholder for factor-timing models."""
+def run_factor_timing_models(standardized_returns: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+  """Placeholder for factor-timing models.
+
+  Operates on the long-form standardized frame; real models should aggregate
+  it with a single groupby over (ASSET_CLASS, BENCHMARK_ID) and only pivot to
+  nested dicts at the output boundary.
+  """
   horizons = config.get("horizons", [])
   results: Dict[str, Any] = {
     "config": config,
     "signals": {},
   }
 
-  for asset_class, df in standardized_returns.items():
-    if df is None or df.empty:
-      continue
+  if standardized_returns is None or standardized_returns.empty:
+    return results
+
+  for asset_class in standardized_returns["ASSET_CLASS"].unique().tolist():
     results["signals"][asset_class] = {
       "dummy_signal": 0.0,
       "horizons": horizons,
@@ -0,0 +1,13 @@
+from __future__ import annotations
+import functools
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path_str: str) -> None:
+  Path(path_str).mkdir(parents=True, exist_ok=True)
+
+
+def ensure_dir(path: Path) -> None:
+  """Create the directory once per process; repeat calls skip the stat/mkdir syscalls."""
+  _ensure_dir(str(path))
@@ -2,16 +2,33 @@ from __future__ import annotations
 from typing import Dict
 import pandas as pd
 
+STANDARD_COLUMNS = ["AS_OF_DATE", "BENCHMARK_ID", "RETURN", "ASSET_CLASS"]
 
-def compute_standard_returns(raw_frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
-  """Standardize different asset-class frames into a common schema."""
-  standardized: Dict[str, pd.DataFrame] = {}
+
+def compute_standard_returns(raw_frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+  """Standardize different asset-class frames into one long-form frame.
+
+  Returns a single DataFrame with columns AS_OF_DATE, BENCHMARK_ID, RETURN, and
+  a categorical ASSET_CLASS, so downstream models run one vectorized
+  groupby-aggregate instead of a Python loop over per-class frames.
+  """
+  frames = []
   for asset_class, df in raw_frames.items():
     if df is None or df.empty:
-      standardized[asset_class] = df
       continue
-    tmp = df.copy()
-    if "DAILY_RETURN" in tmp.columns:
-      tmp = tmp.rename(columns={"DAILY_RETURN": "RETURN"})
-    standardized[asset_class] = tmp[["AS_OF_DATE", "BENCHMARK_ID", "RETURN"]]
+    return_col = "DAILY_RETURN" if "DAILY_RETURN" in df.columns else "RETURN"
+    tmp = df[["AS_OF_DATE", "BENCHMARK_ID", return_col]].rename(columns={return_col: "RETURN"})
+    tmp["ASSET_CLASS"] = asset_class
+    frames.append(tmp)
+
+  if not frames:
+    return pd.DataFrame(columns=STANDARD_COLUMNS)
+
+  standardized = pd.concat(frames, ignore_index=True)
+  # Lean dtypes for downstream math: float32 is ample precision for daily
+  # returns, and categorical IDs cut memory and use pandas' categorical
+  # groupby fast path.
+  standardized["ASSET_CLASS"] = standardized["ASSET_CLASS"].astype("category")
+  standardized["BENCHMARK_ID"] = standardized["BENCHMARK_ID"].astype("category")
+  standardized["RETURN"] = standardized["RETURN"].astype("float32")
   return standardized
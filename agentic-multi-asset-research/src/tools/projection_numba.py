@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+  import numba
+except ImportError:
+  numba = None
+
+
+def _project(total: float, factor: float, contribution: float, months: int) -> np.ndarray:
+  """Compound `total` by `factor` with a fixed contribution for `months` steps."""
+  out = np.empty(months, dtype=np.float64)
+  t = total
+  for i in range(months):
+    t = t * factor + contribution
+    out[i] = t
+  return out
+
+
+if numba is not None:
+  # JIT the tight recurrence for long horizons / Monte Carlo sweeps; cache=True
+  # amortizes the compile across runs. Falls back to plain Python when numba is
+  # not installed — results are identical either way.
+  project_compounded = numba.njit(cache=True)(_project)
+else:
+  project_compounded = _project
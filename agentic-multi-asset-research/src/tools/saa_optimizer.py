@@ -3,7 +3,7 @@ from typing import Dict, Any
 import pandas as pd
 
 
-def run_saa_optimizer(standardized_returns: Dict[str, pd.DataFrame], config: Dict[str, Any]) -> Dict[str, Any]:
+def run_saa_optimizer(standardized_returns: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
   """Placeholder SAA optimizer; returns dummy weights and diagnostics."""
   base_id = config.get("base_saa_id", "GLOBAL_MULTI_ASSET")
   risk_aversion = config.get("risk_aversion", {})
@@ -1,11 +1,19 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List
+import asyncio
+import json
 import os
+import threading
 from loguru import logger
 import snowflake.connector
 import pandas as pd
 
+try:
+  import connectorx
+except ImportError:
+  connectorx = None
+
 
 @dataclass
 class SnowflakeClient:
@@ -16,6 +24,10 @@ class SnowflakeClient:
   database: str
   schema: str
 
+  def __post_init__(self) -> None:
+    self._connection = None
+    self._connect_lock = threading.Lock()
+
   @classmethod
   def from_env(cls, cfg: Dict) -> "SnowflakeClient":
     return cls(
@@ -28,24 +40,101 @@ class SnowflakeClient:
     )
 
   def _conn(self):
-    return snowflake.connector.connect(
-      account=self.account,
-      user=self.user,
-      warehouse=self.warehouse,
-      role=self.role,
-      database=self.database,
-      schema=self.schema,
-    )
+    # One lazily opened connection per client, reused across fetches: the
+    # per-query TLS handshake and auth round trip dominate small result sets.
+    # keep_alive stops the session token expiring between scheduled runs, and
+    # the lock guards creation when DataAgent fans fetches out across threads.
+    if self._connection is None:
+      with self._connect_lock:
+        if self._connection is None:
+          self._connection = snowflake.connector.connect(
+            account=self.account,
+            user=self.user,
+            warehouse=self.warehouse,
+            role=self.role,
+            database=self.database,
+            schema=self.schema,
+            client_session_keep_alive=True,
+          )
+    return self._connection
+
+  def close(self) -> None:
+    if self._connection is not None:
+      self._connection.close()
+      self._connection = None
+
+  def __enter__(self) -> "SnowflakeClient":
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    self.close()
 
-  def fetch_benchmark_returns(self, universe: List[str], as_of_date, frequency: str) -> pd.DataFrame:
+  def fetch_benchmark_returns(
+    self, universe: List[str], as_of_date, frequency: str, lookback_days: int = 400
+  ) -> pd.DataFrame:
     logger.info(f"Fetching {frequency} returns for {len(universe)} benchmarks on {as_of_date}")
-    universe_str = ",".join(f"'{u}'" for u in universe)
-    query = f"""
-      SELECT AS_OF_DATE, BENCHMARK_ID, DAILY_RETURN
+    # The universe is bound as a JSON parameter rather than interpolated into
+    # the SQL text, so every universe shares one cached query plan; the Arrow
+    # result path skips Python-level row assembly entirely. Bounding the date
+    # range lets Snowflake prune micro-partitions instead of scanning (and
+    # shipping) full history, and the casts keep the columns narrow.
+    query = """
+      SELECT AS_OF_DATE::DATE AS AS_OF_DATE, BENCHMARK_ID, DAILY_RETURN::FLOAT AS DAILY_RETURN
       FROM BENCHMARK_RETURNS
-      WHERE BENCHMARK_ID IN ({universe_str})
-        AND AS_OF_DATE <= %s
+      WHERE BENCHMARK_ID IN (SELECT VALUE FROM TABLE(FLATTEN(INPUT => PARSE_JSON(%s))))
+        AND AS_OF_DATE BETWEEN DATEADD(day, -%s, %s) AND %s
     """
-    with self._conn() as conn:
-      df = pd.read_sql(query, conn, params=[as_of_date])
+    if connectorx is not None:
+      # connectorx reads the result straight into Arrow from Rust, skipping
+      # the Python connector entirely. It cannot bind parameters, so the
+      # (config-sourced) values are rendered as literals for this path only.
+      literal_query = query.replace("PARSE_JSON(%s)", f"PARSE_JSON('{json.dumps(universe)}')").replace(
+        "DATEADD(day, -%s, %s) AND %s",
+        f"DATEADD(day, -{int(lookback_days)}, '{as_of_date}'::DATE) AND '{as_of_date}'::DATE",
+      )
+      df = connectorx.read_sql(self._connectorx_uri(), literal_query, protocol="arrow")
+      df["DAILY_RETURN"] = df["DAILY_RETURN"].astype("float32")
+      df["BENCHMARK_ID"] = df["BENCHMARK_ID"].astype("category")
+      return df
+
+    cur = self._conn().cursor()
+    try:
+      cur.execute(query, [json.dumps(universe), lookback_days, as_of_date, as_of_date])
+      # Stream Arrow batches instead of materialising the full float64 result
+      # at once: each batch is downcast to float32 before the next arrives, so
+      # peak memory stays near one batch rather than the whole history.
+      batches = []
+      for batch in cur.fetch_pandas_batches():
+        batch["DAILY_RETURN"] = batch["DAILY_RETURN"].astype("float32")
+        batches.append(batch)
+    finally:
+      cur.close()
+    if not batches:
+      return pd.DataFrame(
+        {
+          "AS_OF_DATE": pd.Series(dtype="datetime64[ns]"),
+          "BENCHMARK_ID": pd.Series(dtype="category"),
+          "DAILY_RETURN": pd.Series(dtype="float32"),
+        }
+      )
+    df = pd.concat(batches, ignore_index=True)
+    df["BENCHMARK_ID"] = df["BENCHMARK_ID"].astype("category")
     return df
+
+  def _connectorx_uri(self) -> str:
+    return (
+      f"snowflake://{self.user}@{self.account}/{self.database}/{self.schema}"
+      f"?warehouse={self.warehouse}&role={self.role}"
+    )
+
+  async def fetch_benchmark_returns_async(
+    self, universe: List[str], as_of_date, frequency: str, lookback_days: int = 400
+  ) -> pd.DataFrame:
+    """Run fetch_benchmark_returns in a worker thread so callers can gather many fetches."""
+    return await asyncio.to_thread(
+      self.fetch_benchmark_returns,
+      universe=universe,
+      as_of_date=as_of_date,
+      frequency=frequency,
+      lookback_days=lookback_days,
+    )
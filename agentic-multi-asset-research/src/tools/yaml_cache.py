@@ -0,0 +1,29 @@
+from __future__ import annotations
+from typing import Any, Dict
+from pathlib import Path
+import functools
+import os
+
+import yaml
+
+try:
+  from yaml import CSafeLoader as _Loader  # libyaml C parser, ~3-10x faster
+except ImportError:
+  from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=128)
+def _load(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+  with open(path_str, "r", encoding="utf-8") as f:
+    return yaml.load(f, Loader=_Loader)
+
+
+def load_yaml(path: Path) -> Dict[str, Any]:
+  """Parse a YAML config, reusing the cached parse until the file changes on disk.
+
+  The cache key is (resolved path, mtime), so repeated agent construction within
+  a process skips the disk read and parse entirely. Callers must treat the
+  returned dict as read-only.
+  """
+  path_str = str(Path(path).resolve())
+  return _load(path_str, os.stat(path_str).st_mtime_ns)